@@ -2,10 +2,23 @@ import tkinter as tk
 from tkinter import ttk, filedialog
 import keyboard
 import threading
+import bisect
 from PIL import Image, ImageTk
 from draggable_components import ThumbnailFrame
 from settings_manager import SettingsManager
 from screenshot_manager import ScreenshotManager
+from preview_window import PreviewWindow
+
+# Layout choices offered for PDF export: label -> (mode, columns, rows)
+PDF_LAYOUTS = {
+    "Auto": ('auto', 1, 1),
+    "1 x 1": ('grid', 1, 1),
+    "1 x 2": ('grid', 1, 2),
+    "2 x 2": ('grid', 2, 2),
+    "2 x 3": ('grid', 2, 3),
+    "3 x 3": ('grid', 3, 3),
+    "3 x 4": ('grid', 3, 4)
+}
 
 class ScreenshotToPDF:
     def __init__(self):
@@ -13,6 +26,9 @@ class ScreenshotToPDF:
         self.settings_manager = SettingsManager()
         self.screenshot_manager = ScreenshotManager()
         self.selected_thumbnail = None
+        self.selected_thumbnails = set()
+        self.selection_anchor = None
+        self.preview_windows = []
         self.columns = 5
         self.dragged_widget = None
         
@@ -43,6 +59,11 @@ class ScreenshotToPDF:
         self.root.bind("<Right>", self.move_thumbnail_right)
         self.root.bind("<Up>", self.move_thumbnail_up)
         self.root.bind("<Down>", self.move_thumbnail_down)
+        self.root.bind("<Shift-Left>", lambda e: self.extend_selection(-1))
+        self.root.bind("<Shift-Right>", lambda e: self.extend_selection(1))
+        self.root.bind("<Shift-Up>", lambda e: self.extend_selection(-self.columns))
+        self.root.bind("<Shift-Down>", lambda e: self.extend_selection(self.columns))
+        self.root.bind("<Control-a>", self.select_all)
         self.root.bind("<Delete>", self.delete_selected)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -68,6 +89,54 @@ class ScreenshotToPDF:
             command=lambda: self.settings_manager.update_setting('compress', self.compress_var.get())
         ).grid(row=0, column=0, padx=5)
 
+        layout = self.get_pdf_layout()
+        self.layout_var = tk.StringVar(value=self._layout_label(layout))
+        self.orientation_var = tk.StringVar(value=layout['orientation'].capitalize())
+
+        ttk.Label(compression_frame, text="PDF Layout:").grid(row=0, column=1, padx=(15, 5))
+        layout_box = ttk.Combobox(compression_frame, textvariable=self.layout_var,
+                                  values=list(PDF_LAYOUTS), state="readonly", width=8)
+        layout_box.grid(row=0, column=2, padx=5)
+        layout_box.bind("<<ComboboxSelected>>", self.on_layout_changed)
+
+        self.orientation_box = ttk.Combobox(compression_frame, textvariable=self.orientation_var,
+                                            values=["Portrait", "Landscape"], state="readonly", width=10)
+        self.orientation_box.grid(row=0, column=3, padx=5)
+        self.orientation_box.bind("<<ComboboxSelected>>", self.on_layout_changed)
+        self._update_orientation_state()
+
+    def get_pdf_layout(self):
+        """Return the saved PDF layout, falling back to the default for unknown values"""
+        default = self.settings_manager.default_settings['pdf_layout']
+        layout = {**default, **self.settings_manager.get_setting('pdf_layout', {})}
+        if self._layout_label(layout) is None:
+            layout.update(mode=default['mode'], columns=default['columns'], rows=default['rows'])
+        if layout['orientation'] not in ('portrait', 'landscape'):
+            layout['orientation'] = default['orientation']
+        return layout
+
+    def _layout_label(self, layout):
+        for label, (mode, columns, rows) in PDF_LAYOUTS.items():
+            if mode == layout['mode'] and (mode == 'auto' or
+                                           (columns, rows) == (layout['columns'], layout['rows'])):
+                return label
+        return None
+
+    def _update_orientation_state(self):
+        # Auto mode picks the orientation of every page itself
+        auto = PDF_LAYOUTS[self.layout_var.get()][0] == 'auto'
+        self.orientation_box.configure(state="disabled" if auto else "readonly")
+
+    def on_layout_changed(self, event):
+        self._update_orientation_state()
+        mode, columns, rows = PDF_LAYOUTS[self.layout_var.get()]
+        self.settings_manager.update_setting('pdf_layout', {
+            'mode': mode,
+            'columns': columns,
+            'rows': rows,
+            'orientation': self.orientation_var.get().lower()
+        })
+
     def _init_screenshots_frame(self, parent):
         list_frame = ttk.LabelFrame(parent, text="Screenshots", padding="5")
         list_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
@@ -107,21 +176,53 @@ class ScreenshotToPDF:
         self.columns = max(1, (width - 20) // 170)  # 170 = thumbnail width (150) + padding
         self.update_thumbnails()
 
-    def select_thumbnail(self, index):
-        if self.selected_thumbnail == index:
+    def select_thumbnail(self, index, extend=False, toggle=False):
+        """
+        Update the selection after a click on a thumbnail
+        
+        Args:
+            index (int): Index of the clicked thumbnail
+            extend (bool): Select the range from the anchor (shift click)
+            toggle (bool): Add or remove the thumbnail (ctrl click)
+        """
+        if extend and self.selection_anchor is not None:
+            low, high = sorted((self.selection_anchor, index))
+            self.selected_thumbnails = set(range(low, high + 1))
+        elif toggle:
+            self.selected_thumbnails ^= {index}
+            self.selection_anchor = index
+        else:
+            self.selected_thumbnails = {index}
+            self.selection_anchor = index
+
+        self.selected_thumbnail = index if index in self.selected_thumbnails else None
+        self.refresh_selection()
+
+    def extend_selection(self, offset):
+        """Extend the selection from the anchor by moving the focus with the keyboard"""
+        if self.selected_thumbnail is None:
             return
-
-        # Deselect previous
-        if self.selected_thumbnail is not None:
-            old_frame = self.get_thumbnail_frame(self.selected_thumbnail)
-            if old_frame:
-                old_frame.set_selected(False)
-
-        # Select new
-        self.selected_thumbnail = index
-        new_frame = self.get_thumbnail_frame(index)
-        if new_frame:
-            new_frame.set_selected(True)
+        index = self.selected_thumbnail + offset
+        if 0 <= index < len(self.screenshot_manager.screenshots):
+            if self.selection_anchor is None:
+                self.selection_anchor = self.selected_thumbnail
+            self.select_thumbnail(index, extend=True)
+
+    def select_all(self, event):
+        count = len(self.screenshot_manager.screenshots)
+        if count:
+            self.selected_thumbnails = set(range(count))
+            self.selection_anchor = 0
+            self.selected_thumbnail = count - 1
+            self.refresh_selection()
+
+    def refresh_selection(self):
+        """Restyle thumbnails without rebuilding the grid"""
+        for widget in self.thumbnail_frame.winfo_children():
+            if isinstance(widget, ThumbnailFrame):
+                selected = widget.index in self.selected_thumbnails
+                if widget.selected != selected:
+                    widget.set_selected(selected)
 
     def get_thumbnail_frame(self, index):
         for widget in self.thumbnail_frame.winfo_children():
@@ -129,38 +230,52 @@ class ScreenshotToPDF:
                 return widget
         return None
 
+    def move_selected(self, new_index):
+        """
+        Move all selected screenshots as one block with a single grid update
+        
+        Args:
+            new_index (int): Insertion position in the current order
+        """
+        old_indices = sorted(self.selected_thumbnails)
+        new_indices = self.screenshot_manager.move_screenshots(old_indices, new_index)
+        if new_indices is None:
+            return
+
+        moved = dict(zip(old_indices, new_indices))
+        self.selected_thumbnails = set(new_indices)
+        self.selected_thumbnail = moved.get(self.selected_thumbnail, new_indices[-1])
+        self.selection_anchor = moved.get(self.selection_anchor, new_indices[0])
+        self.update_thumbnails()
+
+    def move_selection_by(self, offset):
+        if not self.selected_thumbnails:
+            return
+        selected = sorted(self.selected_thumbnails)
+        if offset < 0:
+            target = selected[0] + offset
+            if target >= 0:
+                self.move_selected(target)
+        else:
+            target = selected[-1] + offset
+            if target < len(self.screenshot_manager.screenshots):
+                self.move_selected(target + 1)
+
     def move_thumbnail_left(self, event):
-        if self.selected_thumbnail is not None and self.selected_thumbnail > 0:
-            self.screenshot_manager.reorder_screenshots(self.selected_thumbnail, self.selected_thumbnail - 1)
-            self.selected_thumbnail -= 1
-            self.update_thumbnails()
+        self.move_selection_by(-1)
 
     def move_thumbnail_right(self, event):
-        if (self.selected_thumbnail is not None and 
-            self.selected_thumbnail < len(self.screenshot_manager.screenshots) - 1):
-            self.screenshot_manager.reorder_screenshots(self.selected_thumbnail, self.selected_thumbnail + 1)
-            self.selected_thumbnail += 1
-            self.update_thumbnails()
+        self.move_selection_by(1)
 
     def move_thumbnail_up(self, event):
-        if self.selected_thumbnail is not None and self.selected_thumbnail >= self.columns:
-            new_index = self.selected_thumbnail - self.columns
-            self.screenshot_manager.reorder_screenshots(self.selected_thumbnail, new_index)
-            self.selected_thumbnail = new_index
-            self.update_thumbnails()
+        self.move_selection_by(-self.columns)
 
     def move_thumbnail_down(self, event):
-        if (self.selected_thumbnail is not None and 
-            self.selected_thumbnail + self.columns < len(self.screenshot_manager.screenshots)):
-            new_index = self.selected_thumbnail + self.columns
-            self.screenshot_manager.reorder_screenshots(self.selected_thumbnail, new_index)
-            self.selected_thumbnail = new_index
-            self.update_thumbnails()
+        self.move_selection_by(self.columns)
 
     def delete_selected(self, event):
-        if self.selected_thumbnail is not None:
-            self.remove_screenshot(self.selected_thumbnail)
-            self.selected_thumbnail = None
+        if self.selected_thumbnails:
+            self.remove_screenshots(self.selected_thumbnails)
 
     def take_screenshot(self):
         try:
@@ -184,7 +299,7 @@ class ScreenshotToPDF:
         
         if file_path:
             try:
-                self.screenshot_manager.create_pdf(file_path)
+                self.screenshot_manager.create_pdf(file_path, **self.get_pdf_layout())
                 tk.messagebox.showinfo("Success", "PDF saved successfully!")
             except Exception as e:
                 tk.messagebox.showerror("Error", f"Failed to save PDF: {str(e)}")
@@ -204,43 +319,93 @@ class ScreenshotToPDF:
                 col = i % self.columns
                 frame.grid(row=row, column=col, padx=5, pady=5)
 
-                if i == self.selected_thumbnail:
+                if i in self.selected_thumbnails:
                     frame.set_selected(True)
 
                 serial_num = self.screenshot_manager.serial_numbers[i]
                 serial_label = ttk.Label(frame, text=f"#{serial_num}")
                 serial_label.grid(row=0, column=0, sticky="nw", padx=2, pady=2)
+                frame.bind_drag_events(serial_label)
 
                 label = ttk.Label(frame)
                 label.configure(image=screenshot['thumbnail'])
                 label.image = screenshot['thumbnail']
                 label.grid(row=1, column=0, padx=2, pady=2)
+                frame.bind_drag_events(label)
+                label.bind("<Double-Button-1>", lambda e, idx=i: self.open_preview(idx))
+
+                button_frame = ttk.Frame(frame)
+                button_frame.grid(row=2, column=0, pady=2)
+
+                preview_btn = ttk.Button(button_frame, text="Preview",
+                                       command=lambda idx=i: self.open_preview(idx))
+                preview_btn.grid(row=0, column=0, padx=1)
 
-                remove_btn = ttk.Button(frame, text="Remove",
+                remove_btn = ttk.Button(button_frame, text="Remove",
                                       command=lambda idx=i: self.remove_screenshot(idx))
-                remove_btn.grid(row=2, column=0, pady=2)
+                remove_btn.grid(row=0, column=1, padx=1)
 
             self.thumbnail_frame.update_idletasks()
             self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         finally:
             delattr(self, '_updating')
 
+    def open_preview(self, index):
+        info = self.screenshot_manager.get_screenshot_info(index)
+        if info is None:
+            return
+        try:
+            window = PreviewWindow(self.root, info['path'], title=f"Screenshot #{info['serial_number']}")
+            self.preview_windows = [w for w in self.preview_windows if w.winfo_exists()]
+            self.preview_windows.append(window)
+        except Exception as e:
+            tk.messagebox.showerror("Error", f"Failed to open preview: {str(e)}")
+
+    def close_previews(self, paths=None):
+        """Close previews of the given screenshot paths, or all of them"""
+        for window in self.preview_windows:
+            if window.winfo_exists() and (paths is None or window.pyramid.image_path in paths):
+                window.destroy()
+        self.preview_windows = [w for w in self.preview_windows if w.winfo_exists()]
+
     def remove_screenshot(self, index):
+        self.remove_screenshots([index])
+
+    def remove_screenshots(self, indices):
         if hasattr(self, '_updating'):
             return
-        
-        self.screenshot_manager.remove_screenshot(index)
-        if self.selected_thumbnail is not None:
-            if index < self.selected_thumbnail:
-                self.selected_thumbnail -= 1
-            elif index == self.selected_thumbnail:
-                self.selected_thumbnail = None
+
+        removed = sorted(set(indices))
+
+        # Previews would lose their tiles to the file sweep
+        paths = {self.screenshot_manager.screenshots[i]['path'] for i in removed
+                 if 0 <= i < len(self.screenshot_manager.screenshots)}
+        self.close_previews(paths)
+        self.screenshot_manager.remove_screenshots(removed)
+
+        # Shift the remaining selection past the removed screenshots
+        def remap(index):
+            return index - bisect.bisect_left(removed, index)
+
+        removed_set = set(removed)
+        self.selected_thumbnails = {remap(i) for i in self.selected_thumbnails if i not in removed_set}
+        if self.selected_thumbnail in removed_set or self.selected_thumbnail is None:
+            self.selected_thumbnail = None
+        else:
+            self.selected_thumbnail = remap(self.selected_thumbnail)
+        if self.selection_anchor in removed_set or self.selection_anchor is None:
+            self.selection_anchor = self.selected_thumbnail
+        else:
+            self.selection_anchor = remap(self.selection_anchor)
         self.update_thumbnails()
 
     def clear_screenshots(self):
         if tk.messagebox.askyesno("Confirm", "Are you sure you want to clear all screenshots?"):
+            self.close_previews()
             self.screenshot_manager.clear_screenshots()
             self.selected_thumbnail = None
+            self.selected_thumbnails.clear()
+            self.selection_anchor = None
             self.update_thumbnails()
 
     def keyboard_listener(self):
@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk
 
+# Modifier bits of a Tk event state
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+
 class ThumbnailFrame(ttk.Frame):
     def __init__(self, container, screenshot_app, index, **kwargs):
         super().__init__(container, **kwargs)
@@ -10,6 +14,7 @@ class ThumbnailFrame(ttk.Frame):
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.original_position = None
+        self.pending_select = False
         
         # Configure styles for selection and drag feedback
         self.style = ttk.Style()
@@ -21,16 +26,28 @@ class ThumbnailFrame(ttk.Frame):
         self.configure(style="Normal.TFrame")
         
         # Bind mouse events
-        self.bind("<Button-1>", self.on_click)
-        self.bind("<B1-Motion>", self.on_drag)
-        self.bind("<ButtonRelease-1>", self.on_drop)
+        self.bind_drag_events(self)
         
         # Create placeholder for drag indication
         self.placeholder = None
         
+    def bind_drag_events(self, widget):
+        """Let clicks and drags on a child widget act on the whole thumbnail"""
+        widget.bind("<Button-1>", self.on_click)
+        widget.bind("<B1-Motion>", self.on_drag)
+        widget.bind("<ButtonRelease-1>", self.on_drop)
+
     def on_click(self, event):
         """Handle mouse click event"""
-        self.screenshot_app.select_thumbnail(self.index)
+        extend = bool(event.state & SHIFT_MASK)
+        toggle = bool(event.state & CONTROL_MASK)
+        
+        # Keep a multi-selection on a plain click so it can be dragged as a
+        # whole, it is reduced to this thumbnail on release if no drag starts
+        self.pending_select = (self.selected and not (extend or toggle) and
+                               len(self.screenshot_app.selected_thumbnails) > 1)
+        if not self.pending_select:
+            self.screenshot_app.select_thumbnail(self.index, extend=extend, toggle=toggle)
         # Store initial mouse position
         self.drag_start_x = event.x_root
         self.drag_start_y = event.y_root
@@ -101,8 +118,12 @@ class ThumbnailFrame(ttk.Frame):
         
     def on_drop(self, event):
         """Handle drop event"""
-        if not self.selected or not self.placeholder:
+        if not self.placeholder:
+            if self.pending_select:
+                self.pending_select = False
+                self.screenshot_app.select_thumbnail(self.index)
             return
+        self.pending_select = False
             
         # Get drop coordinates relative to thumbnail frame
         x = event.x_root - self.master.winfo_rootx()
@@ -120,13 +141,16 @@ class ThumbnailFrame(ttk.Frame):
         
         # Reorder if position changed
         if new_index != self.index:
+            # Insert after the target when moving forward so the dragged
+            # thumbnail ends up on the cell it was dropped on
+            if new_index > self.index:
+                new_index += 1
+                
             # Ensure new_index is within bounds
             max_index = len(self.screenshot_app.screenshot_manager.screenshots)
             new_index = max(0, min(new_index, max_index))
             
-            self.screenshot_app.screenshot_manager.reorder_screenshots(self.index, new_index)
-            self.screenshot_app.selected_thumbnail = new_index
-            self.screenshot_app.update_thumbnails()
+            self.screenshot_app.move_selected(new_index)
             
     def end_drag(self):
         """Clean up after drag operation"""
@@ -0,0 +1,233 @@
+import os
+import json
+import math
+import shutil
+import threading
+from PIL import Image
+
+TILE_SIZE = 256
+
+# One lock per screenshot, so a tile cache is never built twice at once
+_build_locks = {}
+_build_locks_guard = threading.Lock()
+
+
+def get_build_lock(image_path):
+    """Return the lock guarding the tile cache of a screenshot"""
+    key = os.path.abspath(image_path)
+    with _build_locks_guard:
+        return _build_locks.setdefault(key, threading.Lock())
+
+
+def get_tile_dir(image_path):
+    """Return the tile cache directory that sits next to a screenshot"""
+    return os.path.splitext(image_path)[0] + "_tiles"
+
+
+def remove_tile_cache(image_path):
+    """Delete the tile cache of a screenshot if one was generated"""
+    tile_dir = get_tile_dir(image_path)
+    # Wait for a build that is still running, it would otherwise keep
+    # writing tiles into the directory being removed
+    with get_build_lock(image_path):
+        if os.path.isdir(tile_dir):
+            shutil.rmtree(tile_dir, ignore_errors=True)
+
+
+class ImagePyramid:
+    """
+    Tiled multi-resolution pyramid for a single screenshot.
+
+    Level 0 is the full resolution image and every following level halves
+    the previous one, until the whole image fits into a single tile. Tiles
+    are generated on first use and cached on disk next to the screenshot,
+    so later previews only decode the tiles they actually display.
+    """
+
+    def __init__(self, image_path, tile_size=TILE_SIZE):
+        self.image_path = image_path
+        self.tile_size = tile_size
+        self.tile_dir = get_tile_dir(image_path)
+        self.meta_path = os.path.join(self.tile_dir, "pyramid.json")
+        self.width = 0
+        self.height = 0
+        self.levels = 0
+        self.built_levels = set()
+
+        self._load_metadata()
+
+    def _load_metadata(self):
+        """Read size and generated levels from an existing cache"""
+        try:
+            with open(self.meta_path, 'r') as f:
+                meta = json.load(f)
+            if meta.get('tile_size') != self.tile_size:
+                return
+            self.width = meta['width']
+            self.height = meta['height']
+            self.levels = meta['levels']
+            self.built_levels = set(meta['built_levels'])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _save_metadata(self):
+        # Write to a temporary file first so readers never see half a file
+        temp_path = self.meta_path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({
+                'tile_size': self.tile_size,
+                'width': self.width,
+                'height': self.height,
+                'levels': self.levels,
+                'built_levels': sorted(self.built_levels)
+            }, f)
+        os.replace(temp_path, self.meta_path)
+
+    def is_built(self):
+        """Return True if every level of the pyramid is cached"""
+        return self.levels > 0 and len(self.built_levels) == self.levels
+
+    def build(self, on_level_ready=None, cancel=None):
+        """
+        Generate all missing levels, coarsest first
+
+        The source image is decoded once and halved repeatedly. Levels are
+        written from the smallest to the largest, so a preview can show a
+        rough version of the image while the detailed levels are still
+        being produced.
+
+        Args:
+            on_level_ready (callable): Called with the level number after
+                each level has been written to disk
+            cancel (threading.Event): Stops the build between two tiles
+                when set, leaving only the finished levels in the cache
+        """
+        cancel = cancel or threading.Event()
+        with get_build_lock(self.image_path):
+            if cancel.is_set():
+                return
+
+            # Another preview may have built the cache while we were waiting
+            self._load_metadata()
+            if self.is_built():
+                if on_level_ready:
+                    for level in reversed(range(self.levels)):
+                        on_level_ready(level)
+                return
+
+            self._build(on_level_ready, cancel)
+
+    def _build(self, on_level_ready, cancel):
+        with Image.open(self.image_path) as source:
+            source.load()
+            image = source if source.mode in ('RGB', 'RGBA') else source.convert('RGB')
+            self.width, self.height = image.size
+            self.levels = self._count_levels(self.width, self.height)
+            os.makedirs(self.tile_dir, exist_ok=True)
+
+            # Halve the image once per level. All levels are kept in memory
+            # until they are written, since tiles are written coarsest first;
+            # the halvings together add about a third of the source size
+            level_images = [image]
+            for _ in range(1, self.levels):
+                if cancel.is_set():
+                    return
+                previous = level_images[-1]
+                level_images.append(previous.reduce(2))
+
+        for level in reversed(range(self.levels)):
+            if level not in self.built_levels:
+                if not self._write_level(level, level_images[level], cancel):
+                    return
+                self.built_levels.add(level)
+                self._save_metadata()
+            # Release each level as soon as its tiles are on disk
+            level_images[level] = None
+            if on_level_ready:
+                on_level_ready(level)
+
+    def _count_levels(self, width, height):
+        levels = 1
+        while max(width, height) > self.tile_size:
+            width = (width + 1) // 2
+            height = (height + 1) // 2
+            levels += 1
+        return levels
+
+    def _write_level(self, level, image, cancel):
+        """Cut a level into tiles, returning False if the build was cancelled"""
+        columns, rows = self.get_grid_size(level, image.size)
+        for row in range(rows):
+            for col in range(columns):
+                if cancel.is_set():
+                    return False
+                box = (
+                    col * self.tile_size,
+                    row * self.tile_size,
+                    min((col + 1) * self.tile_size, image.size[0]),
+                    min((row + 1) * self.tile_size, image.size[1])
+                )
+                image.crop(box).save(self._tile_path(level, col, row))
+        return True
+
+    def _tile_path(self, level, col, row):
+        return os.path.join(self.tile_dir, f"{level}_{col}_{row}.png")
+
+    def get_level_size(self, level):
+        """
+        Get the pixel size of a pyramid level
+
+        Args:
+            level (int): Pyramid level, 0 being full resolution
+
+        Returns:
+            tuple: (width, height) of the level
+        """
+        width, height = self.width, self.height
+        for _ in range(level):
+            width = (width + 1) // 2
+            height = (height + 1) // 2
+        return width, height
+
+    def get_grid_size(self, level, size=None):
+        """Return the number of tile (columns, rows) of a level"""
+        width, height = size or self.get_level_size(level)
+        return math.ceil(width / self.tile_size), math.ceil(height / self.tile_size)
+
+    def get_level_for_scale(self, scale):
+        """
+        Pick the coarsest level that still has enough detail for a zoom scale
+
+        Args:
+            scale (float): Displayed size relative to full resolution
+
+        Returns:
+            int: Best level for the scale
+        """
+        if scale >= 1:
+            return 0
+        level = int(math.floor(math.log2(1 / scale)))
+        return max(0, min(level, self.levels - 1))
+
+    def get_best_available_level(self, level):
+        """Return the closest generated level at or coarser than `level`"""
+        for candidate in range(level, self.levels):
+            if candidate in self.built_levels:
+                return candidate
+        return None
+
+    def load_tile(self, level, col, row):
+        """
+        Decode a single cached tile
+
+        Returns:
+            PIL.Image: Tile image, or None if it is not generated yet
+        """
+        if level not in self.built_levels:
+            return None
+        try:
+            with Image.open(self._tile_path(level, col, row)) as tile:
+                tile.load()
+                return tile
+        except OSError:
+            return None
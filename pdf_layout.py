@@ -0,0 +1,195 @@
+import math
+
+# Page dimensions in mm (A4)
+PAGE_SIZES = {
+    'portrait': (210, 297),
+    'landscape': (297, 210)
+}
+MARGIN = 10
+SPACING = 5          # Space between grid cells
+CAPTION_HEIGHT = 6   # Room below each image for its timestamp
+FOOTER_HEIGHT = 5    # Room above the bottom margin for the page number
+
+# Automatic packing settings
+SCREEN_DPI = 96
+MIN_IMAGE_WIDTH = 80  # Narrowest an image may be printed while staying readable
+MAX_COLUMNS = 4
+MAX_ROWS = 5
+ASPECT_BUCKETS = (0.8, 1.25, 2.0)  # Width/height limits between aspect groups
+
+LAYOUT_MODES = ('grid', 'auto')
+
+
+def get_page_size(orientation):
+    """Return the (width, height) of a page in mm"""
+    if orientation not in PAGE_SIZES:
+        raise ValueError(f"Unknown page orientation: {orientation}")
+    return PAGE_SIZES[orientation]
+
+
+def get_grid_cells(columns, rows, orientation):
+    """
+    Split the usable area of a page into a grid of cells
+
+    Args:
+        columns (int): Number of cells per row
+        rows (int): Number of cells per column
+        orientation (str): 'portrait' or 'landscape'
+
+    Returns:
+        list: (x, y, width, height) of the image area of every cell, row by row
+
+    Raises:
+        ValueError: If the grid leaves no room for the images on the page
+    """
+    if columns < 1 or rows < 1:
+        raise ValueError("Grid needs at least one column and one row")
+
+    page_width, page_height = get_page_size(orientation)
+    usable_width = page_width - 2 * MARGIN
+    usable_height = page_height - 2 * MARGIN - FOOTER_HEIGHT
+
+    cell_width = (usable_width - (columns - 1) * SPACING) / columns
+    cell_height = (usable_height - (rows - 1) * SPACING) / rows
+    if cell_width <= 0 or cell_height - CAPTION_HEIGHT <= 0:
+        raise ValueError(f"Grid of {columns} x {rows} does not fit on a {orientation} page")
+
+    cells = []
+    for row in range(rows):
+        for col in range(columns):
+            cells.append((
+                MARGIN + col * (cell_width + SPACING),
+                MARGIN + row * (cell_height + SPACING),
+                cell_width,
+                cell_height - CAPTION_HEIGHT
+            ))
+    return cells
+
+
+def fit_image(size, cell):
+    """
+    Fit an image into a cell keeping its aspect ratio
+
+    The image is centered horizontally and aligned to the top of the cell,
+    so its caption always sits right below it.
+
+    Args:
+        size (tuple): (width, height) of the image in pixels
+        cell (tuple): (x, y, width, height) of the cell in mm
+
+    Returns:
+        dict: Position and size of the image in mm
+    """
+    x, y, cell_width, cell_height = cell
+    scale = min(cell_width / size[0], cell_height / size[1])
+    width = size[0] * scale
+    height = size[1] * scale
+    return {
+        'x': x + (cell_width - width) / 2,
+        'y': y,
+        'w': width,
+        'h': height
+    }
+
+
+def _grid_pages(indices, sizes, columns, rows, orientation):
+    cells = get_grid_cells(columns, rows, orientation)
+    pages = []
+    for start in range(0, len(indices), len(cells)):
+        placements = []
+        for index, cell in zip(indices[start:start + len(cells)], cells):
+            placement = fit_image(sizes[index], cell)
+            placement['index'] = index
+            placements.append(placement)
+        pages.append({'orientation': orientation, 'placements': placements})
+    return pages
+
+
+def _aspect_bucket(size):
+    aspect = size[0] / size[1]
+    for bucket, limit in enumerate(ASPECT_BUCKETS):
+        if aspect < limit:
+            return bucket
+    return len(ASPECT_BUCKETS)
+
+
+def _readable_width(size):
+    """Narrowest width in mm an image can be printed at without losing detail"""
+    natural_width = size[0] * 25.4 / SCREEN_DPI
+    return min(natural_width, MIN_IMAGE_WIDTH)
+
+
+def _best_grid(group_sizes):
+    """
+    Pick the grid and orientation that need the fewest pages for a group
+
+    A grid is only considered if every image still gets printed at least at
+    its readable width. Ties are broken by the printed image area, so images
+    stay as large as possible.
+    """
+    best = None
+    for orientation in PAGE_SIZES:
+        for columns in range(1, MAX_COLUMNS + 1):
+            for rows in range(1, MAX_ROWS + 1):
+                try:
+                    cells = get_grid_cells(columns, rows, orientation)
+                except ValueError:
+                    continue
+                cell = cells[0]
+
+                fitted = [fit_image(size, cell) for size in group_sizes]
+                if any(f['w'] < _readable_width(size) - 0.01
+                       for f, size in zip(fitted, group_sizes)):
+                    continue
+
+                area = sum(f['w'] * f['h'] for f in fitted) / len(fitted)
+                score = (-math.ceil(len(group_sizes) / len(cells)), area)
+                if best is None or score > best[0]:
+                    best = (score, columns, rows, orientation)
+
+    if best is None:
+        # Nothing fits at a readable size, give every image a page of its own
+        return 1, 1, 'portrait'
+    return best[1:]
+
+
+def compute_layout(sizes, mode='grid', columns=1, rows=2, orientation='portrait'):
+    """
+    Compute the pages of a PDF from image dimensions only
+
+    Args:
+        sizes (list): (width, height) in pixels of every image, in order
+        mode (str): 'grid' places images in order on a fixed N-up grid,
+            'auto' groups images by aspect ratio and picks the grid and
+            orientation that need the fewest pages for each group
+        columns (int): Grid columns in 'grid' mode
+        rows (int): Grid rows in 'grid' mode
+        orientation (str): Page orientation in 'grid' mode
+
+    Returns:
+        list: Pages as dicts with an 'orientation' and a list of
+            'placements', each holding the image 'index' and its
+            'x', 'y', 'w', 'h' in mm
+
+    Raises:
+        ValueError: If the mode or orientation is unknown, or the grid does
+            not fit on the page
+    """
+    if mode not in LAYOUT_MODES:
+        raise ValueError(f"Unknown layout mode: {mode}")
+
+    indices = list(range(len(sizes)))
+    if mode == 'grid':
+        return _grid_pages(indices, sizes, columns, rows, orientation)
+
+    # Group images of similar shape, keeping the original order inside each
+    # group and ordering groups by their first image
+    groups = {}
+    for index in indices:
+        groups.setdefault(_aspect_bucket(sizes[index]), []).append(index)
+
+    pages = []
+    for group in groups.values():
+        group_columns, group_rows, group_orientation = _best_grid([sizes[i] for i in group])
+        pages.extend(_grid_pages(group, sizes, group_columns, group_rows, group_orientation))
+    return pages
@@ -0,0 +1,241 @@
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from PIL import Image, ImageTk
+from image_pyramid import ImagePyramid
+
+class PreviewWindow(tk.Toplevel):
+    """
+    Zoomable full resolution preview of a screenshot.
+
+    The window only decodes the pyramid tiles that intersect the visible
+    area at the current zoom level, so panning and zooming stay responsive
+    even for very large captures.
+    """
+
+    MIN_SCALE = 0.02
+    MAX_SCALE = 8.0
+    ZOOM_STEP = 1.25
+    MAX_CACHED_TILES = 256
+
+    def __init__(self, master, image_path, title="Preview", **kwargs):
+        super().__init__(master, **kwargs)
+        self.title(title)
+        self.geometry("900x650")
+
+        self.pyramid = ImagePyramid(image_path)
+        self.scale = None
+        self.offset_x = 0
+        self.offset_y = 0
+        self.pan_start = None
+        self.redraw_pending = False
+        self.cancel_build = threading.Event()
+
+        # Decoded tiles and their scaled versions for the current zoom level
+        self.tile_cache = OrderedDict()
+        self.photo_cache = {}
+        self.photo_scale = None
+
+        self.canvas = tk.Canvas(self, background="grey20", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.status_var = tk.StringVar()
+        tk.Label(self, textvariable=self.status_var, anchor=tk.W).pack(fill=tk.X)
+
+        # Bind mouse and keyboard events
+        self.canvas.bind("<Configure>", self.on_configure)
+        self.canvas.bind("<ButtonPress-1>", self.on_pan_start)
+        self.canvas.bind("<B1-Motion>", self.on_pan)
+        self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.zoom(self.ZOOM_STEP, e.x, e.y))
+        self.canvas.bind("<Button-5>", lambda e: self.zoom(1 / self.ZOOM_STEP, e.x, e.y))
+        self.bind("<plus>", lambda e: self.zoom(self.ZOOM_STEP))
+        self.bind("<equal>", lambda e: self.zoom(self.ZOOM_STEP))
+        self.bind("<minus>", lambda e: self.zoom(1 / self.ZOOM_STEP))
+        self.bind("<Key-0>", lambda e: self.fit_to_window())
+        self.bind("<Key-1>", lambda e: self.zoom_to(1.0))
+        # Escape is left alone, it is the default global exit hotkey of the app
+        self.bind("<q>", lambda e: self.destroy())
+
+        if self.pyramid.is_built():
+            self.request_redraw()
+        else:
+            self.status_var.set("Generating preview...")
+            threading.Thread(target=self._build_pyramid, daemon=True).start()
+
+        self.focus_set()
+
+    def _build_pyramid(self):
+        """Generate the pyramid in the background and redraw as levels appear"""
+        try:
+            self.pyramid.build(on_level_ready=lambda level: self._after_safe(self.request_redraw),
+                               cancel=self.cancel_build)
+        except Exception as e:
+            # `e` is cleared when the handler ends, so build the text right away
+            message = f"Failed to load preview: {e}"
+            self._after_safe(lambda: self.status_var.set(message))
+
+    def destroy(self):
+        # Stop a running build, nobody is left to show its tiles
+        self.cancel_build.set()
+        super().destroy()
+
+    def _after_safe(self, callback):
+        try:
+            self.after(0, callback)
+        except (tk.TclError, RuntimeError):
+            pass  # Window closed while the pyramid was being built
+
+    def request_redraw(self):
+        """Coalesce several redraw requests into a single one"""
+        if self.redraw_pending:
+            return
+        self.redraw_pending = True
+        self.after_idle(self.redraw)
+
+    def fit_to_window(self):
+        if not self.pyramid.levels:
+            return
+        canvas_width = max(1, self.canvas.winfo_width())
+        canvas_height = max(1, self.canvas.winfo_height())
+        self.scale = min(canvas_width / self.pyramid.width,
+                         canvas_height / self.pyramid.height, 1.0)
+        self.offset_x = (canvas_width - self.pyramid.width * self.scale) / 2
+        self.offset_y = (canvas_height - self.pyramid.height * self.scale) / 2
+        self.request_redraw()
+
+    def zoom_to(self, scale):
+        if self.scale:
+            self.zoom(scale / self.scale)
+
+    def zoom(self, factor, x=None, y=None):
+        """
+        Zoom around a canvas position, keeping the point under it in place
+
+        Args:
+            factor (float): Multiplier applied to the current scale
+            x (int): Canvas x coordinate, defaults to the center
+            y (int): Canvas y coordinate, defaults to the center
+        """
+        if not self.scale:
+            return
+        if x is None:
+            x = self.canvas.winfo_width() / 2
+        if y is None:
+            y = self.canvas.winfo_height() / 2
+
+        new_scale = max(self.MIN_SCALE, min(self.scale * factor, self.MAX_SCALE))
+        factor = new_scale / self.scale
+        self.offset_x = x - (x - self.offset_x) * factor
+        self.offset_y = y - (y - self.offset_y) * factor
+        self.scale = new_scale
+        self.request_redraw()
+
+    def on_configure(self, event):
+        if self.scale is None:
+            self.fit_to_window()
+        else:
+            self.request_redraw()
+
+    def on_pan_start(self, event):
+        self.pan_start = (event.x, event.y)
+
+    def on_pan(self, event):
+        if not self.pan_start:
+            return
+        dx = event.x - self.pan_start[0]
+        dy = event.y - self.pan_start[1]
+        self.offset_x += dx
+        self.offset_y += dy
+        self.pan_start = (event.x, event.y)
+        # Shift the drawn tiles right away, newly exposed ones come with the redraw
+        self.canvas.move("tile", dx, dy)
+        self.request_redraw()
+
+    def on_mouse_wheel(self, event):
+        factor = self.ZOOM_STEP if event.delta > 0 else 1 / self.ZOOM_STEP
+        self.zoom(factor, event.x, event.y)
+
+    def redraw(self):
+        """Draw the tiles intersecting the visible area at the current zoom"""
+        self.redraw_pending = False
+        if not self.winfo_exists():
+            return
+
+        if self.scale is None:
+            self.fit_to_window()
+            return
+
+        wanted_level = self.pyramid.get_level_for_scale(self.scale)
+        level = self.pyramid.get_best_available_level(wanted_level)
+        if level is None:
+            return
+
+        if level != wanted_level:
+            self.status_var.set(f"Generating preview... {self.scale:.0%}")
+        else:
+            self.status_var.set(f"{self.pyramid.width}x{self.pyramid.height}  {self.scale:.0%}")
+
+        # Scaled tiles are only reusable while the zoom level stays the same
+        level_scale = self.scale * (2 ** level)
+        if self.photo_scale != (level, level_scale):
+            self.photo_cache.clear()
+            self.photo_scale = (level, level_scale)
+
+        tile_size = self.pyramid.tile_size
+        level_width, level_height = self.pyramid.get_level_size(level)
+        columns, rows = self.pyramid.get_grid_size(level)
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+
+        # Range of tiles that intersect the canvas
+        first_col = max(0, int(-self.offset_x / (tile_size * level_scale)))
+        last_col = min(columns - 1, int((canvas_width - self.offset_x) / (tile_size * level_scale)))
+        first_row = max(0, int(-self.offset_y / (tile_size * level_scale)))
+        last_row = min(rows - 1, int((canvas_height - self.offset_y) / (tile_size * level_scale)))
+
+        self.canvas.delete("tile")
+        visible = set()
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                # Round both edges so neighbouring tiles never leave a gap
+                x0 = round(self.offset_x + col * tile_size * level_scale)
+                y0 = round(self.offset_y + row * tile_size * level_scale)
+                x1 = round(self.offset_x + min((col + 1) * tile_size, level_width) * level_scale)
+                y1 = round(self.offset_y + min((row + 1) * tile_size, level_height) * level_scale)
+                if x1 <= x0 or y1 <= y0:
+                    continue
+
+                photo = self._get_photo(level, col, row, x1 - x0, y1 - y0)
+                if photo:
+                    self.canvas.create_image(x0, y0, image=photo, anchor=tk.NW, tags="tile")
+                    visible.add((level, col, row))
+
+        # Drop scaled tiles that scrolled out of view
+        for key in list(self.photo_cache):
+            if key not in visible:
+                del self.photo_cache[key]
+
+    def _get_photo(self, level, col, row, width, height):
+        key = (level, col, row)
+        photo = self.photo_cache.get(key)
+        if photo and (photo.width(), photo.height()) == (width, height):
+            return photo
+
+        tile = self.tile_cache.get(key)
+        if tile is None:
+            tile = self.pyramid.load_tile(level, col, row)
+            if tile is None:
+                return None
+            self.tile_cache[key] = tile
+            if len(self.tile_cache) > self.MAX_CACHED_TILES:
+                self.tile_cache.popitem(last=False)
+        else:
+            self.tile_cache.move_to_end(key)
+
+        if tile.size != (width, height):
+            resample = Image.NEAREST if width > tile.size[0] * 2 else Image.BILINEAR
+            tile = tile.resize((width, height), resample)
+
+        photo = ImageTk.PhotoImage(tile)
+        self.photo_cache[key] = photo
+        return photo
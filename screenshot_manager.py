@@ -1,9 +1,13 @@
 import os
+import shutil
+import threading
 from datetime import datetime
 import pyautogui
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from fpdf import FPDF
 import tkinter as tk
+from image_pyramid import remove_tile_cache
+from pdf_layout import compute_layout, get_page_size, MARGIN
 
 class ScreenshotManager:
     def __init__(self, temp_dir="temp_screenshots"):
@@ -27,6 +31,9 @@ class ScreenshotManager:
                 try:
                     if os.path.isfile(file_path):
                         os.unlink(file_path)
+                    elif os.path.isdir(file_path):
+                        # Tile caches generated for previews
+                        shutil.rmtree(file_path)
                 except Exception as e:
                     print(f"Error deleting {file_path}: {e}")
         except Exception as e:
@@ -68,7 +75,8 @@ class ScreenshotManager:
                 'path': filename,
                 'thumbnail': photo,
                 'photo_ref': photo,
-                'timestamp': timestamp
+                'timestamp': timestamp,
+                'size': screenshot.size
             })
             
             # Assign serial number
@@ -87,29 +95,59 @@ class ScreenshotManager:
         Args:
             index (int): Index of screenshot to remove
         """
-        if 0 <= index < len(self.screenshots):
+        self.remove_screenshots([index])
+
+    def remove_screenshots(self, indices):
+        """
+        Remove several screenshots in a single pass
+        
+        The screenshots are dropped from the lists right away, while their
+        files are deleted in one sweep on a background thread.
+        
+        Args:
+            indices (iterable): Indices of screenshots to remove
+            
+        Returns:
+            int: Number of screenshots removed
+        """
+        to_remove = {i for i in indices if 0 <= i < len(self.screenshots)}
+        if not to_remove:
+            return 0
+
+        try:
+            paths = [self.screenshots[i]['path'] for i in sorted(to_remove)]
+            
+            # Rebuild both lists once instead of deleting items one by one
+            kept = [i for i in range(len(self.screenshots)) if i not in to_remove]
+            self.screenshots[:] = [self.screenshots[i] for i in kept]
+            self.serial_numbers[:] = [self.serial_numbers[i] for i in kept]
+            
+            self._start_delete_sweep(paths)
+            return len(to_remove)
+            
+        except Exception as e:
+            raise Exception(f"Failed to remove screenshots: {str(e)}")
+
+    def _start_delete_sweep(self, paths):
+        """Delete files off the UI thread, which may wait on a preview build"""
+        # Not a daemon, so files removed right before quitting are still deleted
+        threading.Thread(target=self._delete_files, args=(paths,)).start()
+
+    def _delete_files(self, paths):
+        """Delete screenshot files and their preview tile caches"""
+        for path in paths:
             try:
-                # Delete file
-                if os.path.exists(self.screenshots[index]['path']):
-                    os.remove(self.screenshots[index]['path'])
-                
-                # Remove from lists
-                del self.screenshots[index]
-                del self.serial_numbers[index]
-                
-            except Exception as e:
-                raise Exception(f"Failed to remove screenshot: {str(e)}")
+                if os.path.exists(path):
+                    os.remove(path)
+                remove_tile_cache(path)
+            except OSError as e:
+                print(f"Error deleting file {path}: {e}")
 
     def clear_screenshots(self):
         """Remove all screenshots"""
         try:
-            # Delete all files
-            for screenshot in self.screenshots:
-                try:
-                    if os.path.exists(screenshot['path']):
-                        os.remove(screenshot['path'])
-                except OSError as e:
-                    print(f"Error deleting file {screenshot['path']}: {e}")
+            # Delete all files in the background
+            self._start_delete_sweep([screenshot['path'] for screenshot in self.screenshots])
             
             # Clear lists
             self.screenshots.clear()
@@ -119,12 +157,19 @@ class ScreenshotManager:
         except Exception as e:
             raise Exception(f"Failed to clear screenshots: {str(e)}")
 
-    def create_pdf(self, file_path):
+    def create_pdf(self, file_path, mode='grid', columns=1, rows=2, orientation='portrait'):
         """
-        Create a PDF from screenshots with two images per page
+        Create a PDF from screenshots laid out on N-up pages
+        
+        The layout is computed up front from the stored image dimensions,
+        so no image file is opened before it is written to the PDF.
         
         Args:
             file_path (str): Path where to save the PDF
+            mode (str): 'grid' for a fixed grid, 'auto' to pack images by aspect ratio
+            columns (int): Images per row in 'grid' mode
+            rows (int): Images per column in 'grid' mode
+            orientation (str): 'portrait' or 'landscape' in 'grid' mode
         
         Returns:
             bool: True if successful, False otherwise
@@ -133,74 +178,39 @@ class ScreenshotManager:
             return False
 
         try:
+            pages = compute_layout(
+                [screenshot['size'] for screenshot in self.screenshots],
+                mode=mode,
+                columns=columns,
+                rows=rows,
+                orientation=orientation
+            )
+
             pdf = FPDF()
+            pdf.set_font('Arial', 'I', 8)
             
-            # A4 dimensions in mm
-            page_width = 210
-            page_height = 297
-            margin = 10
-            
-            # Calculate usable width and spacing
-            usable_width = page_width - (2 * margin)
-            image_width = usable_width
-            spacing = 10  # Space between images
-            
-            # Process screenshots two at a time
-            for i in range(0, len(self.screenshots), 2):
-                pdf.add_page()
-                
-                # First image
-                img1_path = self.screenshots[i]['path']
-                img1 = Image.open(img1_path)
-                aspect1 = img1.size[1] / img1.size[0]
-                
-                # Calculate height for first image (using 40% of page height)
-                img1_height = min(image_width * aspect1, page_height * 0.4)
+            for page in pages:
+                pdf.add_page(orientation=page['orientation'])
+                page_width, page_height = get_page_size(page['orientation'])
                 
-                # Add first image
-                pdf.image(
-                    img1_path,
-                    x=margin,
-                    y=margin,
-                    w=image_width,
-                    h=img1_height
-                )
-                
-                # Add timestamp for first image
-                pdf.set_font('Arial', 'I', 8)
-                timestamp1 = datetime.strptime(self.screenshots[i]['timestamp'], "%Y%m%d_%H%M%S")
-                formatted_time1 = timestamp1.strftime("%Y-%m-%d %H:%M:%S")
-                pdf.text(margin, margin + img1_height + 5, f"Taken: {formatted_time1}")
-                
-                # Second image if available
-                if i + 1 < len(self.screenshots):
-                    img2_path = self.screenshots[i + 1]['path']
-                    img2 = Image.open(img2_path)
-                    aspect2 = img2.size[1] / img2.size[0]
-                    
-                    # Calculate height for second image (using 40% of page height)
-                    img2_height = min(image_width * aspect2, page_height * 0.4)
-                    
-                    # Calculate Y position for second image
-                    y2 = margin + img1_height + spacing + 10  # Add extra 10mm for timestamp
-                    
-                    # Add second image
+                for placement in page['placements']:
+                    screenshot = self.screenshots[placement['index']]
                     pdf.image(
-                        img2_path,
-                        x=margin,
-                        y=y2,
-                        w=image_width,
-                        h=img2_height
+                        screenshot['path'],
+                        x=placement['x'],
+                        y=placement['y'],
+                        w=placement['w'],
+                        h=placement['h']
                     )
                     
-                    # Add timestamp for second image
-                    timestamp2 = datetime.strptime(self.screenshots[i + 1]['timestamp'], "%Y%m%d_%H%M%S")
-                    formatted_time2 = timestamp2.strftime("%Y-%m-%d %H:%M:%S")
-                    pdf.text(margin, y2 + img2_height + 5, f"Taken: {formatted_time2}")
+                    # Add timestamp below the image
+                    timestamp = datetime.strptime(screenshot['timestamp'], "%Y%m%d_%H%M%S")
+                    formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+                    pdf.text(placement['x'], placement['y'] + placement['h'] + 4,
+                             f"Taken: {formatted_time}")
                 
                 # Add page number
-                pdf.set_font('Arial', 'I', 8)
-                pdf.text(page_width - margin - 20, page_height - margin, 
+                pdf.text(page_width - MARGIN - 20, page_height - MARGIN,
                         f'Page {pdf.page_no()}')
 
             pdf.output(file_path)
@@ -242,6 +252,45 @@ class ScreenshotManager:
             print(f"Error reordering screenshots: {e}")
             return False
 
+    def move_screenshots(self, indices, new_index):
+        """
+        Move several screenshots as one block in a single pass
+        
+        The moved screenshots keep their relative order and are inserted
+        before the screenshot currently at new_index.
+        
+        Args:
+            indices (iterable): Current indices of screenshots to move
+            new_index (int): Insertion position in the current order (0 to len)
+            
+        Returns:
+            list: New indices of the moved screenshots, or None if invalid
+        """
+        to_move = sorted(set(indices))
+        if (not to_move or
+                not all(0 <= i < len(self.screenshots) for i in to_move) or
+                not 0 <= new_index <= len(self.screenshots)):
+            return None
+            
+        try:
+            moving = set(to_move)
+            entries = list(zip(self.screenshots, self.serial_numbers))
+            block = [entries[i] for i in to_move]
+            rest = [entry for i, entry in enumerate(entries) if i not in moving]
+            
+            # Position among the remaining screenshots
+            insert_at = new_index - sum(1 for i in to_move if i < new_index)
+            entries = rest[:insert_at] + block + rest[insert_at:]
+            
+            self.screenshots[:] = [screenshot for screenshot, _ in entries]
+            self.serial_numbers[:] = [serial_num for _, serial_num in entries]
+            
+            return list(range(insert_at, insert_at + len(block)))
+            
+        except Exception as e:
+            print(f"Error moving screenshots: {e}")
+            return None
+
     def get_screenshot_info(self, index):
         """
         Get information about a screenshot
@@ -257,6 +306,7 @@ class ScreenshotManager:
             return {
                 'path': screenshot['path'],
                 'timestamp': screenshot['timestamp'],
+                'size': screenshot['size'],
                 'serial_number': self.serial_numbers[index]
             }
         return None
@@ -10,7 +10,13 @@ class SettingsManager:
                 "exit": "esc"
             },
             "quality": 95,
-            "compress": False
+            "compress": False,
+            "pdf_layout": {
+                "mode": "grid",
+                "columns": 1,
+                "rows": 2,
+                "orientation": "portrait"
+            }
         }
         self.settings = self.load_settings()
 